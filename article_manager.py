@@ -1,34 +1,394 @@
 """ArticleManager class for managing Instapaper bookmark operations and navigation."""
 
+import functools
+import hashlib
+import json
 import os
+import re
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+
+# Number of parsed articles kept by parse_current_article_sentences()
+SENTENCE_CACHE_SIZE = 32
+
+# Leading whitespace trimmed from each parsed sentence
+_LEADING_SPACE = re.compile(r"\s*")
+
+# Attribute getters for bulk extraction from bookmark lists
+_TITLE = attrgetter("title")
+
+# Maximum number of concurrent Instapaper API requests
+API_WORKERS = 4
+
+# Attempts made for bookmark actions that fail with a network error, and the
+# initial delay in seconds between them (doubled after each attempt)
+API_RETRIES = 3
+RETRY_BACKOFF = 0.3
+
+# Bookmark methods that queue_current_bookmark_action() accepts
+QUEUEABLE_ACTIONS = ("star", "archive", "delete")
+
+# Errors from Instapaper API calls that are reported back to the caller
+_API_ERRORS = (AttributeError, ValueError, RuntimeError, OSError)
+
+# Reported when a bookmark action gets an error status back from the API;
+# the instapaper library signals that by returning False instead of raising
+_REJECTED = "Instapaper rejected the request"
+
+# Environment variable naming the file the bookmark list is saved to
+CACHE_FILE_ENV = "BOOKMARK_CACHE_FILE"
+
+Credentials = namedtuple(
+    "Credentials", ["username", "password", "consumer_key", "consumer_secret"]
+)
+
+# Logged-in Instapaper clients keyed by a hash of consumer key and username
+_CLIENT_CACHE = {}
+_CLIENT_LOCK = threading.Lock()
+
+# spaCy pipelines shared by every ArticleManager in the process
+_NLP_SINGLETON = {}
+_NLP_LOCK = threading.Lock()
+
+
+def load_spacy_model():
+    """Load the sentence-splitting spaCy model once per process.
+
+    Servers that fork workers can call this before forking so the children
+    share the parent's copy of the model.
+    """
+    nlp = _NLP_SINGLETON.get("en")
+    if nlp is None:
+        with _NLP_LOCK:
+            nlp = _NLP_SINGLETON.get("en")
+            if nlp is None:
+                # spaCy pulls in thinc, numpy and friends; only import it when needed
+                import spacy
+
+                # Only sentence boundaries are used, so skip loading the parser,
+                # tagger, NER, etc. and segment with the lighter "senter" component
+                nlp = spacy.load(
+                    "en_core_web_sm",
+                    exclude=[
+                        "tagger",
+                        "parser",
+                        "attribute_ruler",
+                        "lemmatizer",
+                        "ner",
+                    ],
+                )
+                nlp.enable_pipe("senter")
+                # senter embeds tokens itself; with the tagger and parser gone
+                # nothing may be listening to the shared tok2vec, which would
+                # then run on every doc for nothing
+                if (
+                    "tok2vec" in nlp.pipe_names
+                    and not nlp.get_pipe("tok2vec").listening_components
+                ):
+                    nlp.remove_pipe("tok2vec")
+                _NLP_SINGLETON["en"] = nlp
+    return nlp
+
+
+@functools.lru_cache(maxsize=1)
+def _credentials():
+    """Read the Instapaper credentials, loading the .env file only once.
+
+    Every ArticleManager, and every login retry, shares the first result.
+    """
+    # Imported here to keep it off the module import path
+    from dotenv import load_dotenv
+
+    # Load environment variables from .env file
+    load_dotenv()
+    return Credentials(
+        os.getenv("INSTAPAPER_USERNAME"),
+        os.getenv("INSTAPAPER_PASSWORD"),
+        os.getenv("INSTAPAPER_CONSUMER_KEY"),
+        os.getenv("INSTAPAPER_CONSUMER_SECRET"),
+    )
+
+
+def _with_retries(func, *args):
+    """Call func, retrying network errors with exponential backoff."""
+    for attempt in range(API_RETRIES):
+        try:
+            return func(*args)
+        except OSError:
+            if attempt == API_RETRIES - 1:
+                raise
+            time.sleep(RETRY_BACKOFF * 2**attempt)
+    return None
+
+
+def _current_bookmark_action(method):
+    """Run an ArticleManager method on the current bookmark.
+
+    The decorated method is called with the current bookmark and retried on
+    network errors. The wrapper returns (success, title, error_msg).
+    """
+
+    @functools.wraps(method)
+    def wrapper(self):
+        m, error = self._bookmark_to_change()
+        if m is None:
+            return (False, None, error)
+
+        title = m.title
+        try:
+            _with_retries(method, self, m)
+            return (True, title, None)
+        except _API_ERRORS as e:
+            return (False, title, str(e))
+
+    return wrapper
+
+
+class _ThreadLocalHttp:
+    """Gives each thread its own OAuth HTTP client.
+
+    httplib2 connections are not thread-safe, so requests made from worker
+    threads must not share the main thread's connection.
+    """
+
+    def __init__(self, http):
+        self._http = http
+        self._clients = [http]
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._local.http = http
+
+    def _get_http(self):
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = type(self._http)(self._http.consumer, self._http.token)
+            with self._lock:
+                self._clients.append(http)
+            self._local.http = http
+        return http
+
+    def request(self, *args, **kwargs):
+        """Send a request on the calling thread's HTTP client."""
+        return self._get_http().request(*args, **kwargs)
+
+    def close(self):
+        """Close the connections of every thread's HTTP client."""
+        with self._lock:
+            for http in self._clients:
+                http.close()
+
+
+def _bookmark_params(m):
+    """Get the API fields of a bookmark, as accepted by instapaper.Bookmark."""
+    params = {
+        key: value
+        for key, value in vars(m).items()
+        if key != "parent" and not key.startswith("_")
+    }
+    # Bookmark() turns the API's "1"/"0" into a bool; undo that
+    params["starred"] = "1" if m.starred else "0"
+    return params
+
+
+class BookmarkCache:
+    """A bookmark list fetched once and reused until it is invalidated.
+
+    Once the list is older than the TTL it is still returned as-is, while a
+    fresh copy is fetched on the worker pool. If a cache file is set, each
+    fetched list is saved there and the next session starts from it.
+    """
+
+    def __init__(self, get_client, limit, ttl, pool, path=None):
+        """Initialize the cache.
+
+        Args:
+            get_client: Callable returning the logged-in Instapaper client.
+            limit: Maximum number of bookmarks to fetch.
+            ttl: Seconds before the cached list is refreshed.
+            pool: Executor that runs background refreshes.
+            path: Optional JSON file the list is saved to. Defaults to the
+                BOOKMARK_CACHE_FILE environment variable, if set.
+        """
+        self._get_client = get_client
+        self.limit = limit
+        self.ttl = ttl
+        self._pool = pool
+        self.path = path
+        self._saved_checked = False
+        self._restored = False
+        self._marks = None
+        self._timestamp = 0.0
+        # Bumped on invalidation so fetches started before it are discarded
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._refresh_future = None
+
+    @property
+    def marks(self):
+        """The cached bookmark list, possibly stale, or None if not loaded."""
+        return self._marks
+
+    @property
+    def restored(self):
+        """Whether the cached list is the one saved by an earlier session."""
+        return self._restored
+
+    def fetch(self):
+        """Fetch bookmarks from the API and store them in the cache.
+
+        Returns:
+            The fetched bookmarks, or None if the API call failed.
+        """
+        client = self._get_client()
+        with self._lock:
+            generation = self._generation
+            # The saved list is only for the start of a session
+            self._saved_checked = True
+        try:
+            marks = client.bookmarks(limit=self.limit)
+        except _API_ERRORS:
+            return None
+
+        with self._lock:
+            # Drop the result if the cache was invalidated while fetching
+            if generation != self._generation:
+                return marks
+            self._marks = marks
+            self._timestamp = time.monotonic()
+            self._restored = False
+        self._save(marks)
+        return marks
+
+    def _cache_file(self):
+        """Get the file the list is saved to, or None if saving is off."""
+        path = self.path or os.getenv(CACHE_FILE_ENV)
+        return os.path.expanduser(path) if path else None
+
+    def _load_saved(self):
+        """Load the list saved by an earlier session, or None if there is none."""
+        # Log in first: it loads .env, which may set the cache file
+        client = self._get_client()
+        path = self._cache_file()
+        if not path:
+            return None
+        import instapaper
 
-import instapaper
-import spacy
-from dotenv import load_dotenv
+        try:
+            with open(path, encoding="utf-8") as f:
+                saved = json.load(f)
+            if saved["limit"] != self.limit:
+                return None
+            return [instapaper.Bookmark(client, params) for params in saved["marks"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _save(self, marks):
+        """Write the list to the cache file, if one is set."""
+        path = self._cache_file()
+        if not path:
+            return
+        saved = {"limit": self.limit, "marks": [_bookmark_params(m) for m in marks]}
+        try:
+            # Write a temporary file and swap it in so readers never see a
+            # partly written list
+            with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+                json.dump(saved, f)
+            os.replace(f"{path}.tmp", path)
+        except (OSError, ValueError, TypeError):
+            pass
+
+    def get(self):
+        """Get the bookmarks, fetching them if nothing is cached.
+
+        A stale list is returned as-is while a fresh copy is fetched in the
+        background. The first call may return the list saved by an earlier
+        session, which counts as stale.
+        """
+        if self._marks is None and not self._saved_checked:
+            self._saved_checked = True
+            marks = self._load_saved()
+            if marks is not None:
+                with self._lock:
+                    self._marks = marks
+                    self._timestamp = float("-inf")
+                    self._restored = True
+
+        if self._marks is None:
+            return self.fetch()
+
+        if time.monotonic() - self._timestamp > self.ttl:
+            if self._refresh_future is None or self._refresh_future.done():
+                self._refresh_future = self._pool.submit(self.fetch)
+        return self._marks
+
+    def invalidate(self):
+        """Discard the cached list so the next access refetches it."""
+        with self._lock:
+            self._generation += 1
+            self._marks = None
+            self._timestamp = 0.0
+            self._restored = False
 
 
 class ArticleManager:
     """Manages Instapaper bookmark operations and navigation."""
 
-    def __init__(self, bookmark_limit=25):
-        """Initialize the ArticleManager with Instapaper API connection."""
-        self.bookmark_limit = bookmark_limit
+    def __init__(self, bookmark_limit=25, cache_ttl=300, cache_file=None):
+        """Initialize the ArticleManager.
+
+        The Instapaper connection is made on first use rather than here.
+
+        Args:
+            bookmark_limit: Maximum number of bookmarks to fetch.
+            cache_ttl: Seconds before the cached bookmark list is refreshed.
+            cache_file: Optional JSON file the bookmark list is saved to, so
+                the next session can start from it. Defaults to the
+                BOOKMARK_CACHE_FILE environment variable, if set.
+        """
         self.current_index = 0
-        self.instapaper_client = None
-        self._nlp = None  # Lazy load spaCy model
-        self._initialize_client()
+        # The bookmark list current_index points into; when a refresh swaps
+        # in a new list, the index is moved to follow the same bookmark
+        self._index_marks = None
+        # Set when the bookmark the user was shown dropped out of the list on
+        # a refresh, so actions don't silently hit whatever took its place
+        self._current_moved = False
+        # Bookmarks deleted or archived through this manager
+        self._removed_ids = set()
+        self._instapaper_client = None
+        # Worker threads for background and batched API calls
+        self._pool = ThreadPoolExecutor(max_workers=API_WORKERS)
+        self._bookmarks = BookmarkCache(
+            self._client, bookmark_limit, cache_ttl, self._pool, cache_file
+        )
+        # In-flight article text fetches, keyed by bookmark_id
+        self._prefetch_futures = {}
+        # Article texts loaded by prefetch_texts(), keyed by bookmark_id; kept
+        # across list refreshes, which replace the Bookmark objects
+        self._texts = {}
+        # Bookmark actions waiting for flush_pending(), as (action, bookmark)
+        self._pending = []
+        # Parsed sentences keyed by a digest of the article text, oldest first
+        self._sentence_cache = OrderedDict()
+
+    @property
+    def instapaper_client(self):
+        """The logged-in Instapaper client, connecting on first access."""
+        return self._client()
+
+    def _client(self):
+        """Get the Instapaper client, initializing it on first use."""
+        if self._instapaper_client is None:
+            self._initialize_client()
+        return self._instapaper_client
 
     def _initialize_client(self):
         """Initialize the Instapaper client with credentials from .env file."""
-        # Load environment variables from .env file
-        load_dotenv()
-
         try:
             # Get credentials from environment variables
-            login = os.getenv("INSTAPAPER_USERNAME")
-            password = os.getenv("INSTAPAPER_PASSWORD")
-            consumerkey = os.getenv("INSTAPAPER_CONSUMER_KEY")
-            consumersecret = os.getenv("INSTAPAPER_CONSUMER_SECRET")
+            login, password, consumerkey, consumersecret = _credentials()
 
             # Validate that all credentials are present
             if not all([login, password, consumerkey, consumersecret]):
@@ -45,8 +405,24 @@ class ArticleManager:
                     f"Missing required environment variables: {', '.join(missing)}"
                 )
 
-            self.instapaper_client = instapaper.Instapaper(consumerkey, consumersecret)
-            self.instapaper_client.login(login, password)
+            # Reuse a client already logged in by another ArticleManager
+            key = hashlib.sha256(f"{consumerkey}:{login}".encode()).hexdigest()
+            with _CLIENT_LOCK:
+                client = _CLIENT_CACHE.get(key)
+                if client is None:
+                    # The client library pulls in oauth2 and httplib2; only
+                    # import it once a connection is needed
+                    import instapaper
+
+                    client = instapaper.Instapaper(consumerkey, consumersecret)
+                    client.login(login, password)
+                    # login() signs in with a separate HTTP client; share its
+                    # keep-alive connection pool so API calls don't open a
+                    # second TLS connection
+                    client.http.connections = client.client.connections
+                    client.http = _ThreadLocalHttp(client.http)
+                    _CLIENT_CACHE[key] = client
+            self._instapaper_client = client
         except (
             AttributeError,
             ValueError,
@@ -56,43 +432,184 @@ class ArticleManager:
         ) as e:
             raise RuntimeError(f"Error initializing Instapaper client: {e}") from e
 
-    def _get_bookmarks(self):
-        """Get bookmarks with error handling."""
-        if self.instapaper_client is None:
-            return None
-        try:
-            return self.instapaper_client.bookmarks(limit=self.bookmark_limit)
-        except (AttributeError, ValueError, RuntimeError, OSError):
-            return None
+    def close(self):
+        """Close open API connections and stop the background worker threads.
 
-    def get_current_title(self):
-        """Gets the current bookmark title."""
+        The logged-in client stays cached for other instances, which reopen
+        connections as needed.
+        """
+        self._pool.shutdown(wait=False)
+        if self._instapaper_client is not None:
+            self._instapaper_client.http.close()
+
+    def _get_bookmarks(self):
+        """Get bookmarks from the cache, fetching them if needed."""
+        marks = self._bookmarks.get()
+        self._follow_current(marks)
+        return marks
+
+    def _held_bookmarks(self):
+        """Get the cached bookmarks, even if stale, without fetching them."""
+        marks = self._bookmarks.marks
+        self._follow_current(marks)
+        return marks
+
+    def _follow_current(self, marks):
+        """Keep current_index on the same bookmark when the list is replaced.
+
+        A background refresh can swap in a list where the bookmark the user
+        was shown sits at another position. If it is no longer in the list,
+        the index is left as it is.
+        """
+        held = self._index_marks
+        if marks is None or marks is held:
+            return
+
+        if held and 0 <= self.current_index < len(held):
+            bookmark_id = held[self.current_index].bookmark_id
+            for index, m in enumerate(marks):
+                if m.bookmark_id == bookmark_id:
+                    self.current_index = index
+                    break
+            else:
+                # The next bookmark sliding into place is expected only when
+                # this manager removed the current one
+                if bookmark_id not in self._removed_ids:
+                    self._current_moved = True
+        self._index_marks = marks
+
+    def _bookmarks_to_change(self):
+        """Get the bookmark list for actions that change bookmarks.
+
+        Returns (marks, error_msg); marks is None when there is no list that
+        is safe to act on.
+        """
         marks = self._get_bookmarks()
+        if self._bookmarks.restored:
+            # Never act on a list saved by an earlier session
+            if self._bookmarks.fetch() is None:
+                return (None, "Could not refresh the bookmark list")
+            marks = self._get_bookmarks()
+
         if not marks:
-            return None
+            return (None, "No bookmarks found")
+        return (marks, None)
+
+    def _bookmark_to_change(self):
+        """Get the current bookmark for an action that changes it.
+
+        Returns (bookmark, error_msg); bookmark is None when there is no
+        bookmark that is safe to act on.
+        """
+        marks, error = self._bookmarks_to_change()
+        if marks is None:
+            return (None, error)
+
+        if self._current_moved:
+            return (None, "The current bookmark is no longer in the list")
+
+        m = self._current_mark(marks)
+        if m is None:
+            return (None, "Current index is out of range")
+        return (m, None)
+
+    def _removed(self, m):
+        """Record that a bookmark was deleted or archived."""
+        self._removed_ids.add(m.bookmark_id)
+        self._texts.pop(m.bookmark_id, None)
+
+    def _invalidate(self):
+        """Discard the cached bookmarks and any article text being prefetched."""
+        self._bookmarks.invalidate()
+        self._prefetch_futures.clear()
+
+    def _read_text(self, m):
+        """Get a bookmark's text, waiting for its prefetch if one is running."""
+        text = self._texts.get(m.bookmark_id)
+        if text is not None:
+            return text
+
+        future = self._prefetch_futures.pop(m.bookmark_id, None)
+        if future is not None:
+            try:
+                text = future.result()
+            except _API_ERRORS:
+                text = None
+            # The text is None when the API answered with an error status;
+            # treat that as a miss and ask again
+            if text is not None:
+                return text
+        return str(m.text)
+
+    def _prefetch_text(self, marks, index):
+        """Start fetching the text of the bookmark at index in the background."""
+        if not 0 <= index < len(marks):
+            return
+        m = marks[index]
+        if m.bookmark_id not in self._prefetch_futures:
+            self._prefetch_futures[m.bookmark_id] = self._pool.submit(lambda: m.text)
+
+    def prefetch_current_article(self):
+        """Start fetching the current article's text in the background.
+
+        A later get_current_article() waits for this fetch instead of making
+        its own request. Does nothing until the bookmark list is loaded.
+        """
+        marks = self._held_bookmarks()
+        if marks:
+            self._prefetch_text(marks, self.current_index)
+
+    def refresh_bookmarks(self):
+        """Refetch the bookmark list from Instapaper.
+
+        Returns:
+            True if the bookmarks were fetched, False otherwise.
+        """
+        self._invalidate()
+        return self._bookmarks.fetch() is not None
 
-        if 0 <= self.current_index < len(marks):
-            m = marks[self.current_index]
-            return str(m.title)
+    def _known_length(self):
+        """Get the number of bookmarks, using the held list even if stale.
+
+        Navigation only needs the length, which rarely changes, so it should
+        not wait on or trigger a refresh when a list is already cached.
+        """
+        marks = self._held_bookmarks()
+        if marks is None:
+            marks = self._get_bookmarks()
+        return len(marks) if marks else 0
+
+    def _current_mark(self, marks):
+        """Get the current bookmark from an already fetched list, or None."""
+        if marks and 0 <= self.current_index < len(marks):
+            return marks[self.current_index]
         return None
 
+    def get_current_title(self):
+        """Gets the current bookmark title."""
+        m = self._current_mark(self._get_bookmarks())
+        # The user now sees what the current bookmark is
+        self._current_moved = False
+        return str(m.title) if m is not None else None
+
     def get_current_article(self):
         """Gets the content of the current bookmark."""
         marks = self._get_bookmarks()
-        if not marks:
+        self._current_moved = False
+        m = self._current_mark(marks)
+        if m is None:
             return None
 
-        if 0 <= self.current_index < len(marks):
-            m = marks[self.current_index]
-            return str(m.text)
-        else:
-            return None
+        text = self._read_text(m)
+        # Fetch the next article while this one is being read
+        self._prefetch_text(marks, self.current_index + 1)
+        return text
 
     def next_bookmark(self):
         """Navigates to the next bookmark."""
-        marks = self._get_bookmarks()
-        if marks and self.current_index < len(marks) - 1:
+        if self.current_index < self._known_length() - 1:
             self.current_index += 1
+            self._current_moved = False
             return True
         return False
 
@@ -100,22 +617,24 @@ class ArticleManager:
         """Navigates to the previous bookmark."""
         if self.current_index > 0:
             self.current_index -= 1
+            self._current_moved = False
             return True
         return False
 
     def first_bookmark(self):
         """Navigates to the first bookmark."""
-        marks = self._get_bookmarks()
-        if marks:
+        if self._known_length():
             self.current_index = 0
+            self._current_moved = False
             return True
         return False
 
     def last_bookmark(self):
         """Navigates to the last bookmark."""
-        marks = self._get_bookmarks()
-        if marks:
-            self.current_index = len(marks) - 1
+        length = self._known_length()
+        if length:
+            self.current_index = length - 1
+            self._current_moved = False
             return True
         return False
 
@@ -124,41 +643,19 @@ class ArticleManager:
         marks = self._get_bookmarks()
         if not marks:
             return []
-        return [m.title for m in marks]
+        return list(map(_TITLE, marks))
 
-    def delete_current_bookmark(self):
+    @_current_bookmark_action
+    def delete_current_bookmark(self, m):
         """Deletes the currently selected bookmark. Returns (success, title, error_msg)."""
-        marks = self._get_bookmarks()
-        if not marks:
-            return (False, None, "No bookmarks found")
+        m.delete()
+        self._removed(m)
+        self._invalidate()
 
-        if 0 <= self.current_index < len(marks):
-            m = marks[self.current_index]
-            title = m.title
-            try:
-                m.delete()
-                return (True, title, None)
-            except (AttributeError, ValueError, RuntimeError, OSError) as e:
-                return (False, title, str(e))
-        else:
-            return (False, None, "Current index is out of range")
-
-    def star_current_bookmark(self):
+    @_current_bookmark_action
+    def star_current_bookmark(self, m):
         """Stars the currently selected bookmark. Returns (success, title, error_msg)."""
-        marks = self._get_bookmarks()
-        if not marks:
-            return (False, None, "No bookmarks found")
-
-        if 0 <= self.current_index < len(marks):
-            m = marks[self.current_index]
-            title = m.title
-            try:
-                m.star()
-                return (True, title, None)
-            except (AttributeError, ValueError, RuntimeError, OSError) as e:
-                return (False, title, str(e))
-        else:
-            return (False, None, "Current index is out of range")
+        m.star()
 
     def add_bookmark_url(self, url):
         """Adds a new bookmark. Returns (success, url, error_msg)."""
@@ -166,14 +663,17 @@ class ArticleManager:
             return (False, url, "No URL provided")
 
         url = url.strip()
+        import instapaper
+
         try:
             # Create a new Bookmark object and save it
             # The instapaper library requires creating a Bookmark instance
             # with the parent client and params, then calling save()
             bookmark = instapaper.Bookmark(self.instapaper_client, {"url": url})
             bookmark.save()
+            self._invalidate()
             return (True, url, None)
-        except (AttributeError, ValueError, RuntimeError, OSError) as e:
+        except _API_ERRORS as e:
             return (False, url, str(e))
 
     def create_highlight_for_current(self, highlight_text, position=0):
@@ -185,44 +685,150 @@ class ArticleManager:
 
         Returns (success, title, highlight_text, error_msg).
         """
-        marks = self._get_bookmarks()
-        if not marks:
-            return (False, None, highlight_text, "No bookmarks found")
-
-        if 0 <= self.current_index < len(marks):
-            m = marks[self.current_index]
-            title = m.title
+        m, error = self._bookmark_to_change()
+        if m is None:
+            return (False, None, highlight_text, error)
 
-            if not highlight_text or not highlight_text.strip():
-                return (False, title, highlight_text, "No text provided for highlight")
+        title = m.title
+        if not highlight_text or not highlight_text.strip():
+            return (False, title, highlight_text, "No text provided for highlight")
 
-            highlight_text = highlight_text.strip()
-            try:
-                # Try creating highlight without position parameter
-                # The Instapaper API may be strict about position matching
-                m.create_highlight(highlight_text)
-                return (True, title, highlight_text, None)
-            except (AttributeError, ValueError, RuntimeError, OSError) as e:
-                return (False, title, highlight_text, str(e))
-        else:
-            return (False, None, highlight_text, "Current index is out of range")
-
-    def archive_current_bookmark(self):
+        highlight_text = highlight_text.strip()
+        try:
+            # Try creating highlight without position parameter
+            # The Instapaper API may be strict about position matching
+            m.create_highlight(highlight_text)
+            return (True, title, highlight_text, None)
+        except _API_ERRORS as e:
+            return (False, title, highlight_text, str(e))
+
+    @_current_bookmark_action
+    def archive_current_bookmark(self, m):
         """Archives the currently selected bookmark. Returns (success, title, error_msg)."""
+        m.archive()
+        self._removed(m)
+        self._invalidate()
+
+    def prefetch_texts(self, bookmark_numbers):
+        """Fetch the article text of several bookmarks concurrently.
+
+        Fetched texts are kept by bookmark_id, even when the bookmark list
+        is refreshed, so reading them afterwards needs no further API calls.
+
+        Args:
+            bookmark_numbers: The bookmark numbers (1-based) to fetch.
+
+        Returns:
+            A list with the article text for each number, in the same order,
+            or None where the number is out of range or the fetch failed.
+        """
         marks = self._get_bookmarks()
         if not marks:
-            return (False, None, "No bookmarks found")
+            return [None] * len(bookmark_numbers)
+
+        def fetch(bookmark_number):
+            index = bookmark_number - 1
+            if not 0 <= index < len(marks):
+                return None
+            try:
+                # None when the API answered with an error status
+                return marks[index].text
+            except _API_ERRORS:
+                return None
+
+        texts = list(self._pool.map(fetch, bookmark_numbers))
+        for bookmark_number, text in zip(bookmark_numbers, texts):
+            if text is not None:
+                self._texts[marks[bookmark_number - 1].bookmark_id] = text
+        return texts
 
-        if 0 <= self.current_index < len(marks):
-            m = marks[self.current_index]
+    def archive_many(self, bookmark_numbers):
+        """Archive several bookmarks concurrently.
+
+        Args:
+            bookmark_numbers: The bookmark numbers (1-based) to archive.
+
+        Returns:
+            A list of (success, title, error_msg) tuples, in the same order.
+        """
+        marks, error = self._bookmarks_to_change()
+        if marks is None:
+            return [(False, None, error)] * len(bookmark_numbers)
+
+        def archive(bookmark_number):
+            index = bookmark_number - 1
+            if not 0 <= index < len(marks):
+                return (False, None, "Bookmark number is out of range")
+            m = marks[index]
             title = m.title
             try:
-                m.archive()
+                if _with_retries(m.archive) is False:
+                    return (False, title, _REJECTED)
+                self._removed(m)
                 return (True, title, None)
-            except (AttributeError, ValueError, RuntimeError, OSError) as e:
+            except _API_ERRORS as e:
                 return (False, title, str(e))
-        else:
-            return (False, None, "Current index is out of range")
+
+        results = list(self._pool.map(archive, bookmark_numbers))
+        if any(success for success, _, _ in results):
+            self._invalidate()
+        return results
+
+    def queue_current_bookmark_action(self, action):
+        """Queue an action on the current bookmark to be sent later.
+
+        Queued actions are sent together, concurrently, by flush_pending().
+
+        Args:
+            action: One of QUEUEABLE_ACTIONS.
+
+        Returns (success, title, error_msg), where success means queued.
+        """
+        if action not in QUEUEABLE_ACTIONS:
+            return (False, None, f"Unknown bookmark action: {action}")
+
+        m, error = self._bookmark_to_change()
+        if m is None:
+            return (False, None, error)
+
+        self._pending.append((action, m))
+        return (True, m.title, None)
+
+    def pending_count(self):
+        """Gets the number of queued bookmark actions."""
+        return len(self._pending)
+
+    def flush_pending(self):
+        """Send all queued bookmark actions concurrently.
+
+        Actions that fail stay queued for the next flush.
+
+        Returns:
+            A list of (action, success, title, error_msg) tuples, in the
+            order the actions were queued.
+        """
+        pending, self._pending = self._pending, []
+
+        def send(item):
+            action, m = item
+            try:
+                if _with_retries(getattr(m, action)) is False:
+                    return (action, False, m.title, _REJECTED)
+                if action != "star":
+                    self._removed(m)
+                return (action, True, m.title, None)
+            # Any failure, including httplib2's transport errors, is reported
+            # in the result and the action kept, rather than lost
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                return (action, False, m.title, str(e))
+
+        results = list(self._pool.map(send, pending))
+        failed = [item for item, result in zip(pending, results) if not result[1]]
+        self._pending[:0] = failed
+        # Starring leaves the list as it is; only removals need a refetch
+        if any(success and action != "star" for action, success, _, _ in results):
+            self._invalidate()
+        return results
 
     def get_bookmark_count(self):
         """Gets the total number of bookmarks."""
@@ -235,8 +841,7 @@ class ArticleManager:
 
     def is_valid_index(self):
         """Checks if the current index is valid."""
-        marks = self._get_bookmarks()
-        return marks is not None and 0 <= self.current_index < len(marks)
+        return self._current_mark(self._get_bookmarks()) is not None
 
     def get_current_bookmark_info(self):
         """Gets info about the current bookmark.
@@ -244,10 +849,10 @@ class ArticleManager:
         Returns (title, url, index, total_count) or None.
         """
         marks = self._get_bookmarks()
-        if not marks or not 0 <= self.current_index < len(marks):
+        m = self._current_mark(marks)
+        if m is None:
             return None
 
-        m = marks[self.current_index]
         return (str(m.title), str(m.url), self.current_index, len(marks))
 
     def set_bookmark_by_number(self, bookmark_number):
@@ -268,6 +873,7 @@ class ArticleManager:
 
         if 0 <= index < len(marks):
             self.current_index = index
+            self._current_moved = False
             return True
         return False
 
@@ -289,24 +895,33 @@ class ArticleManager:
 
         if 0 <= index < len(marks):
             m = marks[index]
-            return str(m.text)
+            text = self._read_text(m)
+            self._prefetch_text(marks, index + 1)
+            return text
         return None
 
     def _load_spacy_model(self):
         """Lazy load the spaCy model when needed."""
-        if self._nlp is None:
-            self._nlp = spacy.load("en_core_web_sm")
-        return self._nlp
+        return load_spacy_model()
 
-    def parse_current_article_sentences(self):
-        """Parse the current article into sentences using spaCy.
+    def iter_current_article_sentences(self):
+        """Yield the current article's sentences as they are segmented.
 
-        Returns:
-            list[str]: A list of sentence strings, or None if no article is available.
+        Yields:
+            tuple[str, int, int]: The sentence text and its start and end
+            character offsets in the article text.
         """
         article_text = self.get_current_article()
         if not article_text:
-            return None
+            return
+
+        # Reuse the result if this article was parsed recently
+        key = hashlib.blake2b(article_text.encode(), digest_size=16).digest()
+        cached = self._sentence_cache.get(key)
+        if cached is not None:
+            self._sentence_cache.move_to_end(key)
+            yield from cached
+            return
 
         # Load spaCy model
         nlp = self._load_spacy_model()
@@ -314,11 +929,28 @@ class ArticleManager:
         # Process the text
         doc = nlp(article_text)
 
-        # Extract sentences
+        # Extract sentences, offsetting past any whitespace that was stripped
         sentences = []
         for sent in doc.sents:
-            text = sent.text.strip()
+            raw = sent.text
+            lead = _LEADING_SPACE.match(raw).end()
+            text = raw[lead:].rstrip()
             if text:
-                sentences.append(text)
+                start = sent.start_char + lead
+                sentence = (text, start, start + len(text))
+                sentences.append(sentence)
+                yield sentence
+
+        # Only cache articles that were iterated to the end
+        self._sentence_cache[key] = tuple(sentences)
+        if len(self._sentence_cache) > SENTENCE_CACHE_SIZE:
+            self._sentence_cache.popitem(last=False)
+
+    def parse_current_article_sentences(self):
+        """Parse the current article into sentences using spaCy.
 
+        Returns:
+            list[str]: A list of sentence strings, or None if no article is available.
+        """
+        sentences = [text for text, _, _ in self.iter_current_article_sentences()]
         return sentences if sentences else None
@@ -12,6 +12,8 @@ def example_usage():
         manager = ArticleManager(
             bookmark_limit=10
         )  # Limit to 10 bookmarks for this example
+        # The manager connects lazily; load bookmarks now so login errors show here
+        manager.refresh_bookmarks()
         print("✅ ArticleManager initialized successfully!")
     except (
         AttributeError,
@@ -1,33 +1,109 @@
 """A simple console application to interact with Instapaper bookmarks."""
 
+import functools
+import io
 import os
+import select
+import shutil
+import signal
 import sys
 import termios
 import textwrap
-import time
 import tty
 
 from article_manager import ArticleManager
 
+# Move the cursor home and clear to the end of the screen
+CLEAR_HOME = "\033[H\033[J"
+
+# Console banner and help text
+WELCOME = "Welcome to the Instapaper Console App!"
+HELP = (
+    "Commands: 'bookmarks' (a), 'add', 'delete' (d), 'star' (s), 'highlight', "
+    "'archive' (c), 'speak' (k), 'read' (r), 'preload', 'flush', or 'exit'."
+)
+NAV_HELP = "Navigation: 'title', 'next' (n), 'prev' (p), 'first', 'last'"
+NUMBER_HELP = "With numbers: 'read <number>' (r <number>), 'speak <number>' (k <number>), '<number>'"
+UNKNOWN = (
+    "Unknown command. Try: 'bookmarks' (a), 'add', 'delete' (d), 'star' (s), "
+    "'highlight', 'archive' (c), 'speak' (k), 'read' (r), 'next' (n), 'prev' (p), "
+    "'first', 'last', 'title', '<number>', 'read <number>', 'speak <number>', "
+    "'preload', 'flush', or 'exit'."
+)
+
+# Past tense of queued bookmark actions, for reporting them once sent
+ACTION_DONE = {"star": "starred", "archive": "archived", "delete": "deleted"}
+
+# TextWrapper instances keyed by line width, reused across calls
+_WRAPPERS = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _get_line_width():
+    """Get the configured line width, reading the environment only once.
+
+    This is first called after the Instapaper client has loaded .env, so
+    SPEAK_LINE_WIDTH set there is picked up.
+    """
+    # Get line width from environment variable, default to 70
+    return int(os.getenv("SPEAK_LINE_WIDTH", "70"))
+
+
+def _wrapper(width):
+    """Get the shared TextWrapper for a line width, creating it on first use.
+
+    Lines are not broken at hyphens, which lets textwrap split words with its
+    simpler whitespace-only pattern.
+    """
+    wrapper = _WRAPPERS.get(width)
+    if wrapper is None:
+        wrapper = textwrap.TextWrapper(width=width, break_on_hyphens=False)
+        _WRAPPERS[width] = wrapper
+    return wrapper
+
+
+def _fits_on_line(text, width):
+    """Check whether textwrap would return the text unchanged on one line."""
+    # Non-printable characters include tabs and newlines, which textwrap
+    # rewrites; it also drops trailing whitespace
+    return len(text) <= width and text.isprintable() and not text[-1:].isspace()
+
+
+def _fill(text, width):
+    """Wrap text into a single string, skipping textwrap for short lines."""
+    if _fits_on_line(text, width):
+        return text
+    return _wrapper(width).fill(text)
+
 
-def slow_print(text, delay=0.05):
-    """Prints strings slowly to the console."""
-    for char in text:
-        print(char, end="", flush=True)
-        time.sleep(delay)
-    print()
+def _wrap(text, width):
+    """Wrap text into a list of lines, skipping textwrap for short lines."""
+    if _fits_on_line(text, width):
+        return [text] if text else []
+    return _wrapper(width).wrap(text)
+
+
+def display_missing_bookmark(manager, count=None):
+    """Explain why there is no current bookmark to display."""
+    if count is None:
+        count = manager.get_bookmark_count()
+    if count == 0:
+        print("No bookmarks found.")
+    else:
+        print("Current index is out of range.")
 
 
 def display_title(manager):
     """Display the current bookmark title."""
-    title = manager.get_current_title()
+    # Looking up the count first loads the bookmark list once; the title is
+    # then read from the manager's cache, and an empty or failed fetch is
+    # not repeated just to explain the missing title
+    count = manager.get_bookmark_count()
+    title = manager.get_current_title() if count else None
     if title:
         print(title)
     else:
-        if manager.get_bookmark_count() == 0:
-            print("No bookmarks found.")
-        else:
-            print("Current index is out of range.")
+        display_missing_bookmark(manager, count)
 
 
 def display_article(manager, bookmark_number=None):
@@ -37,32 +113,21 @@ def display_article(manager, bookmark_number=None):
         manager: The ArticleManager instance
         bookmark_number: Optional bookmark number (1-based) to read. If None, reads current bookmark.
     """
-    # Get line width from environment variable, default to 70
-    line_width = int(os.getenv("SPEAK_LINE_WIDTH", "70"))
-    if bookmark_number is not None:
-        # Navigate to and read specific bookmark by number
-        if manager.set_bookmark_by_number(bookmark_number):
-            article = manager.get_current_article()
-            if article:
-                # Apply word wrapping to the article text
-                wrapped_text = textwrap.fill(article, width=line_width)
-                print(wrapped_text)
-            else:
-                print(f"Unable to read bookmark {bookmark_number}")
-        else:
-            print(f"Invalid bookmark number: {bookmark_number}")
+    # Navigate to a specific bookmark by number first, if one was given
+    if bookmark_number is not None and not manager.set_bookmark_by_number(
+        bookmark_number
+    ):
+        print(f"Invalid bookmark number: {bookmark_number}")
+        return
+
+    article = manager.get_current_article()
+    if article:
+        # Apply word wrapping to the article text
+        print(_fill(article, _get_line_width()))
+    elif bookmark_number is not None:
+        print(f"Unable to read bookmark {bookmark_number}")
     else:
-        # Read current bookmark
-        article = manager.get_current_article()
-        if article:
-            # Apply word wrapping to the article text
-            wrapped_text = textwrap.fill(article, width=line_width)
-            print(wrapped_text)
-        else:
-            if manager.get_bookmark_count() == 0:
-                print("No bookmarks found.")
-            else:
-                print("Current index is out of range.")
+        display_missing_bookmark(manager)
 
 
 def display_bookmarks(manager):
@@ -71,8 +136,20 @@ def display_bookmarks(manager):
     if not bookmarks:
         print("No bookmarks found.")
     else:
-        for i, title in enumerate(bookmarks, start=1):
-            print(f"{i}. {title}")
+        print("\n".join(f"{i}. {title}" for i, title in enumerate(bookmarks, start=1)))
+
+
+def handle_preload(manager):
+    """Handle preloading the text of every bookmark for offline reading."""
+    count = manager.get_bookmark_count()
+    if count == 0:
+        print("No bookmarks found.")
+        return
+
+    print(f"Loading {count} articles...")
+    texts = manager.prefetch_texts(range(1, count + 1))
+    loaded = sum(text is not None for text in texts)
+    print(f"Loaded {loaded} of {count} articles.")
 
 
 def handle_add_bookmark(manager):
@@ -106,14 +183,38 @@ def handle_delete_bookmark(manager):
 
 
 def handle_star_bookmark(manager):
-    """Handle starring the current bookmark."""
-    success, title, error = manager.star_current_bookmark()
+    """Handle starring the current bookmark.
+
+    The star is queued and sent with any other queued actions by 'flush' or
+    on exit.
+    """
+    success, title, error = manager.queue_current_bookmark_action("star")
     if success:
-        print(f"Bookmark '{title}' starred successfully.")
+        print(
+            f"Bookmark '{title}' will be starred "
+            f"({manager.pending_count()} pending; 'flush' to send now)."
+        )
     else:
         print(f"Error starring bookmark: {error}")
 
 
+def handle_flush(manager):
+    """Handle sending queued bookmark actions."""
+    if not manager.pending_count():
+        print("No pending actions.")
+        return
+
+    for action, success, title, error in manager.flush_pending():
+        if success:
+            print(f"Bookmark '{title}' {ACTION_DONE[action]} successfully.")
+        else:
+            print(f"Error with {action} for '{title}': {error}")
+
+    remaining = manager.pending_count()
+    if remaining:
+        print(f"{remaining} action(s) could not be sent and are still pending.")
+
+
 def handle_create_highlight(manager):
     """Handle creating a highlight for the current bookmark."""
     info = manager.get_current_bookmark_info()
@@ -123,23 +224,26 @@ def handle_create_highlight(manager):
 
     title = info[0]
     print(f"Creating highlight for: {title}")
-    print("Enter the text you want to highlight (press Enter twice to finish):")
-
-    lines = []
-    empty_line_count = 0
-    while empty_line_count < 2:
-        line = input()
-        if line.strip() == "":
-            empty_line_count += 1
-        else:
-            empty_line_count = 0
-        lines.append(line)
 
-    # Remove the last empty lines
-    while lines and lines[-1].strip() == "":
-        lines.pop()
+    if not sys.stdin.isatty():
+        # Piped input: the rest of stdin is the highlight text
+        highlight_text = sys.stdin.read().strip()
+    else:
+        print("Enter the text you want to highlight (press Enter twice to finish):")
+
+        # Blank lines are only kept once more text follows them, so the
+        # two that end the input never need to be removed afterwards
+        lines = []
+        pending_blanks = 0
+        while pending_blanks < 2:
+            line = input()
+            if line.strip() == "":
+                pending_blanks += 1
+            else:
+                lines.append("\n" * pending_blanks + line)
+                pending_blanks = 0
 
-    highlight_text = "\n".join(lines).strip()
+        highlight_text = "\n".join(lines).strip()
 
     if not highlight_text:
         print("No text entered. Highlight cancelled.")
@@ -165,6 +269,21 @@ def handle_archive_bookmark(manager):
         print(f"Error archiving bookmark: {error}")
 
 
+def _read_keys(fd):
+    """Block for a key press and return it with any keys queued behind it.
+
+    Holding a key down fills the input buffer faster than a frame can be
+    drawn, so the whole burst is drained and handed back at once.
+    """
+    keys = os.read(fd, 1024)
+    while keys and select.select([fd], [], [], 0)[0]:
+        more = os.read(fd, 1024)
+        if not more:
+            break
+        keys += more
+    return keys.decode(errors="ignore")
+
+
 def handle_speak(manager):
     """Handle speak mode - display article sentences one at a time.
 
@@ -180,17 +299,24 @@ def handle_speak(manager):
     print(f"\n--- Entering Speak Mode ({len(sentences)} sentences) ---")
     print("Press SPACE for next, B for back, H to highlight, Q to quit\n")
 
-    # Get line width from environment variable, default to 70
-    line_width = int(os.getenv("SPEAK_LINE_WIDTH", "70"))
+    line_width = _get_line_width()
 
     # Save terminal settings
     fd = sys.stdin.fileno()
     old_settings = termios.tcgetattr(fd)
 
-    # Get terminal size
-    import shutil
+    # Blank lines that center the sentence vertically (roughly middle of
+    # screen); recomputed from the terminal size whenever it is resized
+    padding = ""
+    resized = [True]
 
-    terminal_height = shutil.get_terminal_size().lines
+    def on_resize(_signum, _frame):
+        resized[0] = True
+
+    old_winch_handler = signal.signal(signal.SIGWINCH, on_resize)
+
+    # Sentence counter, e.g. "[3/42]"; \r returns the cursor to column 0
+    header_fmt = f"[{{}}/{len(sentences)}]\n\r"
 
     try:
         # Set terminal to raw mode to read single characters
@@ -198,6 +324,8 @@ def handle_speak(manager):
 
         sentence_index = 0
         display_sentence = True
+        # Wrapped text per sentence index, filled in as sentences are shown
+        wrapped_cache = {}
 
         while sentence_index < len(sentences):
             # Get sentence text
@@ -205,105 +333,189 @@ def handle_speak(manager):
 
             # Display sentence centered vertically (only if flag is True)
             if display_sentence:
-                # Wrap the sentence text using configured line width
-                wrapped_lines = textwrap.wrap(sentence_text, width=line_width)
-                # Join with \n\r to ensure cursor returns to column 0 after each line
-                wrapped_text = "\n\r".join(wrapped_lines)
-
-                # Clear screen
-                sys.stdout.write("\033[2J")
-                # Calculate vertical center (roughly middle of screen)
-                padding_lines = terminal_height // 2 - 2
-                # Move cursor to top and add padding
-                sys.stdout.write("\033[H")  # Move cursor to home position
-                sys.stdout.write("\n" * padding_lines)
-                # Display sentence count and wrapped sentence (with \r after newline)
-                sys.stdout.write(
-                    f"[{sentence_index + 1}/{len(sentences)}]\n\r{wrapped_text}"
+                if resized[0]:
+                    resized[0] = False
+                    terminal_height = shutil.get_terminal_size().lines
+                    padding = "\n" * (terminal_height // 2 - 2)
+
+                wrapped_text = wrapped_cache.get(sentence_index)
+                if wrapped_text is None:
+                    # Wrap the sentence text using configured line width
+                    wrapped_lines = _wrap(sentence_text, line_width)
+                    # Join with \n\r to ensure cursor returns to column 0 after each line
+                    wrapped_text = "\n\r".join(wrapped_lines)
+                    wrapped_cache[sentence_index] = wrapped_text
+
+                # Build the whole frame so it goes out in a single write:
+                # move cursor home and clear, pad down, then the sentence
+                # count and wrapped sentence (with \r after each newline)
+                frame = (
+                    CLEAR_HOME
+                    + padding
+                    + header_fmt.format(sentence_index + 1)
+                    + wrapped_text
                 )
+                sys.stdout.write(frame)
                 sys.stdout.flush()
 
-            # Wait for key press
-            key = sys.stdin.read(1)
-
-            if key.lower() == "q":
+            # Wait for key presses; a burst of repeats (held key) is applied
+            # in full before the sentence is rendered once
+            keys = _read_keys(fd)
+            if not keys:
                 break
-            elif key == " ":
-                sentence_index += 1
-                display_sentence = True
-            elif key.lower() == "b":
-                # Go back one sentence
-                if sentence_index > 0:
-                    sentence_index -= 1
-                display_sentence = True
-                # If already at first sentence, do nothing (stay at index 0)
-            elif key.lower() == "h":
-                # Highlight the current sentence
-                sys.stdout.write("\n\r")  # New line and return to start
-                sys.stdout.flush()
-                # Restore terminal to normal mode temporarily for the highlight operation
-                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
 
-                success, _, _, error = manager.create_highlight_for_current(
-                    sentence_text
-                )
-                if success:
-                    print(
-                        f"✓ Highlighted: {sentence_text[:50]}{'...' if len(sentence_text) > 50 else ''}"
+            # Only redisplay if one of the keys moved between sentences
+            display_sentence = False
+            quit_requested = False
+            for key in keys.lower():
+                if key == "q":
+                    quit_requested = True
+                    break
+                elif key == " ":
+                    sentence_index += 1
+                    display_sentence = True
+                    if sentence_index >= len(sentences):
+                        break
+                elif key == "b":
+                    # Go back one sentence
+                    if sentence_index > 0:
+                        sentence_index -= 1
+                    display_sentence = True
+                    # If already at first sentence, do nothing (stay at index 0)
+                elif key == "h":
+                    # Highlight the current sentence
+                    sentence_text = sentences[sentence_index]
+                    sys.stdout.write("\n\r")  # New line and return to start
+                    sys.stdout.flush()
+                    # Restore terminal to normal mode temporarily for the highlight operation
+                    termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+                    success, _, _, error = manager.create_highlight_for_current(
+                        sentence_text
                     )
-                else:
-                    print(f"✗ Error highlighting: {error}")
+                    if success:
+                        print(
+                            f"✓ Highlighted: {sentence_text[:50]}{'...' if len(sentence_text) > 50 else ''}"
+                        )
+                    else:
+                        print(f"✗ Error highlighting: {error}")
 
-                # Set terminal back to raw mode and wait for next command
-                tty.setraw(fd)
-                display_sentence = False
-            else:
-                # For any other key, don't redisplay
-                display_sentence = False
+                    # Set terminal back to raw mode and wait for next command
+                    tty.setraw(fd)
+                # Any other key is ignored
+
+            if quit_requested:
+                break
 
     finally:
-        # Restore terminal settings
+        # Restore terminal settings and the previous resize handler
         termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        signal.signal(signal.SIGWINCH, old_winch_handler)
 
         # Now print the exit message with normal terminal behavior
         print("\n\n--- Exiting Speak Mode ---")
 
 
+def handle_speak_number(manager, bookmark_number):
+    """Handle speaking a specific bookmark by its number (1-based)."""
+    if manager.set_bookmark_by_number(bookmark_number):
+        handle_speak(manager)
+    else:
+        print(f"Invalid article number: {bookmark_number}")
+
+
+# Navigation directions, mapped to the ArticleManager method that moves in
+# that direction and the message shown when it can't
+NAVIGATION = {
+    "next": ("next_bookmark", "Already at the last bookmark."),
+    "prev": ("prev_bookmark", "Already at the first bookmark."),
+    "first": ("first_bookmark", "No bookmarks found."),
+    "last": ("last_bookmark", "No bookmarks found."),
+}
+
+
 def handle_navigation(manager, direction):
     """Handle navigation commands."""
-    if direction == "next":
-        if manager.next_bookmark():
-            display_title(manager)
-        else:
-            print("Already at the last bookmark.")
-    elif direction == "prev":
-        if manager.prev_bookmark():
-            display_title(manager)
-        else:
-            print("Already at the first bookmark.")
-    elif direction == "first":
-        if manager.first_bookmark():
-            display_title(manager)
-        else:
-            print("No bookmarks found.")
-    elif direction == "last":
-        if manager.last_bookmark():
-            display_title(manager)
-        else:
-            print("No bookmarks found.")
+    method, failure_message = NAVIGATION[direction]
+    if getattr(manager, method)():
+        # Start loading the article while the user reads its title
+        manager.prefetch_current_article()
+        display_title(manager)
+    else:
+        print(failure_message)
+
+
+# Commands that take no arguments, mapped to handlers called with the manager
+COMMANDS = {
+    "bookmarks": display_bookmarks,
+    "articles": display_bookmarks,
+    "a": display_bookmarks,
+    "add": handle_add_bookmark,
+    "delete": handle_delete_bookmark,
+    "d": handle_delete_bookmark,
+    "star": handle_star_bookmark,
+    "s": handle_star_bookmark,
+    "highlight": handle_create_highlight,
+    "archive": handle_archive_bookmark,
+    "c": handle_archive_bookmark,
+    "speak": handle_speak,
+    "k": handle_speak,
+    "title": display_title,
+    "next": functools.partial(handle_navigation, direction="next"),
+    "n": functools.partial(handle_navigation, direction="next"),
+    "previous": functools.partial(handle_navigation, direction="prev"),
+    "prev": functools.partial(handle_navigation, direction="prev"),
+    "p": functools.partial(handle_navigation, direction="prev"),
+    "first": functools.partial(handle_navigation, direction="first"),
+    "last": functools.partial(handle_navigation, direction="last"),
+    "read": display_article,
+    "r": display_article,
+    "preload": handle_preload,
+    "flush": handle_flush,
+}
+
+# Commands that take a bookmark number, mapped to (handler, usage)
+NUMBERED_COMMANDS = {
+    "read": (display_article, "read <number> or r <number>"),
+    "r": (display_article, "read <number> or r <number>"),
+    "speak": (handle_speak_number, "speak <number> or k <number>"),
+    "k": (handle_speak_number, "speak <number> or k <number>"),
+}
+
+
+def handle_numbered_command(manager, name, arg):
+    """Handle "<command> <number>", e.g. "read 3" or "k 5"."""
+    handler, usage = NUMBERED_COMMANDS[name]
+    if " " in arg:
+        print(f"Usage: {usage}")
+        return
+    try:
+        bookmark_num = int(arg)
+    except ValueError:
+        print(f"Invalid bookmark number. Usage: {usage}")
+        return
+    handler(manager, bookmark_num)
+
+
+def handle_bookmark_number(manager, cmd):
+    """Handle input that matched no command: a bare bookmark number or junk."""
+    try:
+        bookmark_num = int(cmd)
+    except ValueError:
+        print(UNKNOWN)
+        return
+    if manager.set_bookmark_by_number(bookmark_num):
+        display_title(manager)
+    else:
+        print(f"Invalid article number: {bookmark_num}")
 
 
 def run_console(manager):
     """Main console interface."""
-    print("Welcome to the Instapaper Console App!")
-    print(
-        "Commands: 'bookmarks' (a), 'add', 'delete' (d), 'star' (s), 'highlight', "
-        "'archive' (c), 'speak' (k), 'read' (r), or 'exit'."
-    )
-    print("Navigation: 'title', 'next' (n), 'prev' (p), 'first', 'last'")
-    print(
-        "With numbers: 'read <number>' (r <number>), 'speak <number>' (k <number>), '<number>'"
-    )
+    print(WELCOME)
+    print(HELP)
+    print(NAV_HELP)
+    print(NUMBER_HELP)
 
     # Display the current bookmark title at startup
     display_title(manager)
@@ -311,82 +523,29 @@ def run_console(manager):
     while True:
         try:
             cmd = input("> ").strip()
-            cmd_lower = cmd.lower()
-
-            if cmd_lower == "exit":
+            # Split off the command word; only it needs case folding. Interning
+            # it makes the table lookups below match the keys by identity
+            name, _, arg = cmd.partition(" ")
+            name = sys.intern(name.casefold())
+            arg = arg.strip()
+            handler = None if arg else COMMANDS.get(name)
+
+            if name == "exit" and not arg:
+                if manager.pending_count():
+                    handle_flush(manager)
                 print("Goodbye!")
                 break
-            elif (
-                cmd_lower == "bookmarks" or cmd_lower == "articles" or cmd_lower == "a"
-            ):
-                display_bookmarks(manager)
-            elif cmd_lower == "add":
-                handle_add_bookmark(manager)
-            elif cmd_lower == "delete" or cmd_lower == "d":
-                handle_delete_bookmark(manager)
-            elif cmd_lower == "star" or cmd_lower == "s":
-                handle_star_bookmark(manager)
-            elif cmd_lower == "highlight":
-                handle_create_highlight(manager)
-            elif cmd_lower == "archive" or cmd_lower == "c":
-                handle_archive_bookmark(manager)
-            elif cmd_lower == "speak" or cmd_lower == "k":
-                handle_speak(manager)
-            elif cmd_lower == "title":
-                display_title(manager)
-            elif cmd_lower == "next" or cmd_lower == "n":
-                handle_navigation(manager, "next")
-            elif cmd_lower == "previous" or cmd_lower == "prev" or cmd_lower == "p":
-                handle_navigation(manager, "prev")
-            elif cmd_lower == "first":
-                handle_navigation(manager, "first")
-            elif cmd_lower == "last":
-                handle_navigation(manager, "last")
-            elif cmd_lower == "read" or cmd_lower == "r":
-                display_article(manager)
-            elif cmd_lower.startswith("read ") or cmd_lower.startswith("r "):
-                # Handle "read <number>" or "r <number>" command
-                try:
-                    parts = cmd.split()
-                    if len(parts) == 2:
-                        bookmark_num = int(parts[1])
-                        display_article(manager, bookmark_num)
-                    else:
-                        print("Usage: read <number> or r <number>")
-                except ValueError:
-                    print("Invalid bookmark number. Usage: read <number> or r <number>")
-            elif cmd_lower.startswith("speak ") or cmd_lower.startswith("k "):
-                # Handle "speak <number>" or "k <number>" command
-                try:
-                    parts = cmd.split()
-                    if len(parts) == 2:
-                        bookmark_num = int(parts[1])
-                        if manager.set_bookmark_by_number(bookmark_num):
-                            handle_speak(manager)
-                        else:
-                            print(f"Invalid article number: {bookmark_num}")
-                    else:
-                        print("Usage: speak <number> or k <number>")
-                except ValueError:
-                    print(
-                        "Invalid bookmark number. Usage: speak <number> or k <number>"
-                    )
+            elif handler is not None:
+                handler(manager)
+            elif arg and name in NUMBERED_COMMANDS:
+                handle_numbered_command(manager, name, arg)
             else:
-                # Check if the input is just a number
-                try:
-                    bookmark_num = int(cmd)
-                    if manager.set_bookmark_by_number(bookmark_num):
-                        display_title(manager)
-                    else:
-                        print(f"Invalid article number: {bookmark_num}")
-                except ValueError:
-                    print(
-                        "Unknown command. Try: 'bookmarks' (a), 'add', 'delete' (d), 'star' (s), "
-                        "'highlight', 'archive' (c), 'speak' (k), 'read' (r), 'next' (n), 'prev' (p), "
-                        "'first', 'last', 'title', '<number>', 'read <number>', 'speak <number>', or 'exit'."
-                    )
-        except KeyboardInterrupt:
-            print("\nGoodbye!")
+                handle_bookmark_number(manager, cmd)
+        except (KeyboardInterrupt, EOFError):
+            print()
+            if manager.pending_count():
+                handle_flush(manager)
+            print("Goodbye!")
             break
         except (AttributeError, ValueError, RuntimeError, OSError) as e:
             print(f"An error occurred: {e}")
@@ -394,6 +553,11 @@ def run_console(manager):
 
 def main():
     """Main function to run the Instapaper console app."""
+    if not sys.stdout.isatty() and isinstance(sys.stdout, io.TextIOWrapper):
+        # Output redirected to a file or pipe doesn't need per-line flushes
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
+    manager = None
     try:
         manager = ArticleManager()
         run_console(manager)
@@ -403,6 +567,11 @@ def main():
     except KeyboardInterrupt:
         print("\nGoodbye!")
         return
+    finally:
+        # Close the kept-alive API connections and background workers
+        if manager is not None:
+            manager.close()
+        sys.stdout.flush()
 
 
 if __name__ == "__main__":